@@ -60,7 +60,20 @@ class HDF5IO(HDMFIO):
             {'name': 'file', 'type': [File, "S3File"], 'doc': 'a pre-existing h5py.File object', 'default': None},
             {'name': 'driver', 'type': str, 'doc': 'driver for h5py to use when opening HDF5 file', 'default': None},
             {'name': 'external_resources_path', 'type': str,
-             'doc': 'The path to the ExternalResources', 'default': None},)
+             'doc': 'The path to the ExternalResources', 'default': None},
+            {'name': 'rdcc_nbytes', 'type': int,
+             'doc': ('the size of the raw data chunk cache in bytes for each dataset (h5py default: 1 MiB). '
+                     'Increase this when reading chunked datasets with selections that span many chunks. '
+                     'Ignored if a pre-existing file object is supplied.'),
+             'default': None},
+            {'name': 'rdcc_nslots', 'type': int,
+             'doc': ('the number of chunk slots in the raw data chunk cache for each dataset (h5py default: 521). '
+                     'Ignored if a pre-existing file object is supplied.'),
+             'default': None},
+            {'name': 'rdcc_w0', 'type': (int, float),
+             'doc': ('the chunk preemption policy for all datasets, between 0 and 1 (h5py default: 0.75). '
+                     'Ignored if a pre-existing file object is supplied.'),
+             'default': None},)
     def __init__(self, **kwargs):
         """Open an HDF5 file for IO.
         """
@@ -69,6 +82,9 @@ class HDF5IO(HDMFIO):
                                                                                        'comm', 'file', 'driver',
                                                                                        'external_resources_path',
                                                                                        kwargs)
+        rdcc_nbytes, rdcc_nslots, rdcc_w0 = popargs('rdcc_nbytes', 'rdcc_nslots', 'rdcc_w0', kwargs)
+        if rdcc_w0 is not None and not 0 <= rdcc_w0 <= 1:
+            raise ValueError("rdcc_w0 must be between 0 and 1, got %s" % rdcc_w0)
 
         self.__open_links = []  # keep track of other files opened from links in this file
         self.__file = None  # This will be set below, but set to None first in case an error occurs and we need to close
@@ -89,6 +105,9 @@ class HDF5IO(HDMFIO):
             manager = BuildManager(manager)
         self.__driver = driver
         self.__comm = comm
+        # chunk cache settings passed to h5py.File when opening the file
+        self.__chunk_cache = {k: v for k, v in (('rdcc_nbytes', rdcc_nbytes), ('rdcc_nslots', rdcc_nslots),
+                                                ('rdcc_w0', rdcc_w0)) if v is not None}
         self.__mode = mode
         self.__file = file_obj
         super().__init__(manager, source=path, external_resources_path=external_resources_path)
@@ -752,8 +771,15 @@ class HDF5IO(HDMFIO):
             if self.driver is not None:
                 kwargs.update(driver=self.driver)
 
+            kwargs.update(self.__chunk_cache)
             self.__file = File(self.source, open_flag, **kwargs)
 
+    def flush(self):
+        """Flush the buffers of the open HDF5 file to disk."""
+        if not self.__file:
+            raise UnsupportedOperation("Cannot flush closed HDF5 file '%s'" % self.source)
+        self.__file.flush()
+
     def close(self, close_links=True):
         """Close this file and any files linked to from this file.
 
@@ -34,7 +34,6 @@ class HDMFIO(metaclass=ABCMeta):
             source = os.path.abspath(source)
 
         self.__manager = manager
-        self.__built = dict()
         self.__source = source
         self.external_resources_path = external_resources_path
         self.external_resources = None
@@ -54,7 +53,7 @@ class HDMFIO(metaclass=ABCMeta):
     def read(self, **kwargs):
         """Read a container from the IO source."""
         f_builder = self.read_builder()
-        if all(len(v) == 0 for v in f_builder.values()):
+        if not any(f_builder.values()):
             # TODO also check that the keys are appropriate. print a better error message
             raise UnsupportedOperation('Cannot build data. There are no values.')
         container = self.__manager.construct(f_builder)
@@ -88,7 +87,7 @@ class HDMFIO(metaclass=ABCMeta):
                      'exported'),
              'default': None},
             {'name': 'write_args', 'type': dict, 'doc': 'arguments to pass to :py:meth:`write_builder`',
-             'default': dict()},
+             'default': None},
             {'name': 'clear_cache', 'type': bool, 'doc': 'whether to clear the build manager cache',
              'default': False})
     def export(self, **kwargs):
@@ -119,35 +118,45 @@ class HDMFIO(metaclass=ABCMeta):
               current file (even if the Builder.source points to a different location).
         """
         src_io, container, write_args, clear_cache = getargs('src_io', 'container', 'write_args', 'clear_cache', kwargs)
+        if write_args is None:
+            write_args = dict()
         if container is None and clear_cache:
             # clear all containers and builders from cache so that they can all get rebuilt with export=True.
             # constructing the container is not efficient but there is no elegant way to trigger a
             # rebuild of src_io with new source.
             container = src_io.read()
         if container is not None:
-            # check that manager exists, container was built from manager, and container is root of hierarchy
-            if src_io.manager is None:
-                raise ValueError('When a container is provided, src_io must have a non-None manager (BuildManager) '
-                                 'property.')
-            old_bldr = src_io.manager.get_builder(container)
-            if old_bldr is None:
-                raise ValueError('The provided container must have been read by the provided src_io.')
-            if old_bldr.parent is not None:
-                raise ValueError('The provided container must be the root of the hierarchy of the '
-                                 'source used to read the container.')
-
-            # NOTE in HDF5IO, clear_cache is set to True when link_data is False
-            if clear_cache:
-                # clear all containers and builders from cache so that they can all get rebuilt with export=True
-                src_io.manager.clear_cache()
-            else:
-                # clear only cached containers and builders where the container was modified
-                src_io.manager.purge_outdated()
-            bldr = src_io.manager.build(container, source=self.__source, root=True, export=True)
+            self._export_container(src_io, container, write_args, clear_cache)
+        else:
+            self._export_all(src_io, write_args)
+
+    def _export_container(self, src_io, container, write_args, clear_cache):
+        """Build the given root container with the build manager of src_io and write the resulting builder."""
+        # check that manager exists, container was built from manager, and container is root of hierarchy
+        if src_io.manager is None:
+            raise ValueError('When a container is provided, src_io must have a non-None manager (BuildManager) '
+                             'property.')
+        old_bldr = src_io.manager.get_builder(container)
+        if old_bldr is None:
+            raise ValueError('The provided container must have been read by the provided src_io.')
+        if old_bldr.parent is not None:
+            raise ValueError('The provided container must be the root of the hierarchy of the '
+                             'source used to read the container.')
+
+        # NOTE in HDF5IO, clear_cache is set to True when link_data is False
+        if clear_cache:
+            # clear all containers and builders from cache so that they can all get rebuilt with export=True
+            src_io.manager.clear_cache()
         else:
-            bldr = src_io.read_builder()
+            # clear only cached containers and builders where the container was modified
+            src_io.manager.purge_outdated()
+        bldr = src_io.manager.build(container, source=self.__source, root=True, export=True)
         self.write_builder(builder=bldr, **write_args)
 
+    def _export_all(self, src_io, write_args):
+        """Write the builders read from src_io without constructing containers."""
+        self.write_builder(builder=src_io.read_builder(), **write_args)
+
     @abstractmethod
     @docval(returns='a GroupBuilder representing the read data', rtype='GroupBuilder')
     def read_builder(self):
@@ -171,6 +180,11 @@ class HDMFIO(metaclass=ABCMeta):
         ''' Close this HDMFIO object to further reading/writing'''
         pass
 
+    def flush(self):
+        ''' Flush any buffered data of this HDMFIO object to the IO source. Backends that buffer writes should
+        override this method. '''
+        pass
+
     def __enter__(self):
         return self
 
@@ -6,16 +6,36 @@ from ...build import ObjectMapper
 @register_map(ExternalResources)
 class ExternalResourcesMap(ObjectMapper):
 
+    def __init__(self, spec):
+        super().__init__(spec)
+        self.__id_key = spec.id_key()
+        self.__parent_proxy = None  # (parent_builder, Proxy) while an ExternalResources is being constructed
+
+    def construct(self, *args, **kwargs):
+        # all tables of an ExternalResources share the same parent, so resolve its Proxy at most once per construct
+        try:
+            return super().construct(*args, **kwargs)
+        finally:
+            self.__parent_proxy = None
+
+    def __get_parent_proxy(self, parent_builder, manager):
+        cached = self.__parent_proxy
+        if cached is not None and cached[0] is parent_builder:
+            return cached[1]
+        parent = manager._get_proxy_builder(parent_builder)
+        self.__parent_proxy = (parent_builder, parent)
+        return parent
+
     def construct_helper(self, name, parent_builder, table_cls, manager):
         """Create a new instance of table_cls with data from parent_builder[name].
 
            The DatasetBuilder for name is associated with data_type Data and container class Data,
            but users should use the more specific table_cls for these datasets.
         """
-        parent = manager._get_proxy_builder(parent_builder)
+        parent = self.__get_parent_proxy(parent_builder, manager)
         builder = parent_builder[name]
         src = builder.source
-        oid = builder.attributes.get(self.spec.id_key())
+        oid = builder.attributes.get(self.__id_key)
         kwargs = dict(name=builder.name, data=builder.data)
         return self.__new_container__(table_cls, src, parent, oid, **kwargs)
 
@@ -132,6 +132,42 @@ class VectorIndex(VectorData):
             self.target.extend(arg, **kwargs)
         self.append(self.__check_precision(len(self.target)))
 
+    def extend(self, arg, **kwargs):
+        """
+        Add each of the given data values to the target VectorData and append the corresponding indices to this
+        VectorIndex. This is equivalent to calling :py:func:`add_vector` for each data value, but the precision
+        of this VectorIndex is checked and adjusted only once.
+
+        :param arg: The iterable of data values to be added to self.target, one value per row
+        """
+        if isinstance(self.target, VectorIndex):
+            for a in arg:
+                self.add_vector(a, **kwargs)
+            return
+        arg = list(arg)
+        try:
+            lengths = [len(a) for a in arg]
+        except TypeError as e:
+            raise ValueError("Each value added to VectorIndex '%s' must be a list or array." % self.name) from e
+        if len(lengths) == 0:
+            return
+        # extend the target with all values at once, so that if they are rejected, e.g., by the term set of the
+        # target, neither the target nor this VectorIndex is modified
+        ends = len(self.target) + np.cumsum(lengths)
+        values = list(itertools.chain.from_iterable(arg))
+        if len(values) > 0:
+            self.target.extend(values, **kwargs)
+        self.__check_precision(ends[-1])  # the last index is the largest
+        ends = ends.astype(self.__uint)
+        if isinstance(self.data, list):
+            self.data.extend(ends)
+        elif isinstance(self.data, np.ndarray):
+            # use self._Data__data to work around restriction on resetting self.data
+            self._Data__data = np.concatenate((self.data, ends))
+        else:
+            for end in ends:
+                self.append(end)
+
     def __check_precision(self, idx):
         """
         Check precision of current dataset and, if necessary, adjust precision to accommodate new value.
@@ -140,13 +176,13 @@ class VectorIndex(VectorData):
             unsigned integer encoding of idx
         """
         if idx > self.__maxval:
-            while idx > self.__maxval:
-                nbits = (np.log2(self.__maxval + 1) * 2)  # 8->16, 16->32, 32->64
-                if nbits == 128:  # pragma: no cover
-                    msg = ('Cannot store more than 18446744073709551615 elements in a VectorData. Largest dtype '
-                           'allowed for VectorIndex is uint64.')
-                    raise ValueError(msg)
-                self.__maxval = 2 ** nbits - 1
+            # smallest of 16, 32, 64 bits that can hold idx, i.e., the next power of two of its bit length
+            nbits = 1 << (int(idx).bit_length() - 1).bit_length()
+            if nbits > 64:  # pragma: no cover
+                msg = ('Cannot store more than 18446744073709551615 elements in a VectorData. Largest dtype '
+                       'allowed for VectorIndex is uint64.')
+                raise ValueError(msg)
+            self.__maxval = 2 ** nbits - 1
             self.__uint = np.dtype('uint%d' % nbits).type
             self.__adjust_precision(self.__uint)
         return self.__uint(idx)
@@ -156,8 +192,8 @@ class VectorIndex(VectorData):
         Adjust precision of data to specified unsigned integer precision.
         """
         if isinstance(self.data, list):
-            for i in range(len(self.data)):
-                self.data[i] = uint(self.data[i])
+            # cast all values at once and update the list in place to keep the list type and identity
+            self.data[:] = list(np.asarray(self.data, dtype=uint))
         elif isinstance(self.data, np.ndarray):
             # use self._Data__data to work around restriction on resetting self.data
             self._Data__data = self.data.astype(uint)
@@ -182,6 +218,23 @@ class VectorIndex(VectorData):
         end = self.data[arg]
         return self.target.get(slice(start, end), **kwargs)
 
+    def __get_range(self, start, stop, **kwargs):
+        """
+        Internal helper function used by get to retrieve the data values for a contiguous range of elements of this
+        VectorIndex from self.target. All index values needed are read from self.data with a single slice.
+
+        :param start: Index of the first element to retrieve
+        :param stop: Index after the last element to retrieve
+        :param kwargs: any additional arguments to *get* method of the self.target VectorData
+        :return: List of values retrieved
+        """
+        if stop <= start:
+            return list()
+        ends = self.data[start:stop]
+        starts = [0 if start == 0 else self.data[start - 1]]
+        starts.extend(ends[:-1])
+        return [self.target.get(slice(s, e), **kwargs) for s, e in zip(starts, ends)]
+
     def __getitem__(self, arg):
         """
         Select elements in this VectorIndex and retrieve the corresponding data from the self.target VectorData
@@ -203,11 +256,14 @@ class VectorIndex(VectorData):
             return self.__getitem_helper(arg, **kwargs)
         else:
             if isinstance(arg, slice):
-                indices = list(range(*arg.indices(len(self.data))))
+                start, stop, step = arg.indices(len(self.data))
+                if step == 1:
+                    return self.__get_range(start, stop, **kwargs)
+                indices = list(range(start, stop, step))
             else:
-                if isinstance(arg[0], bool):
-                    arg = np.where(arg)[0]
-                indices = arg
+                indices = np.asarray(arg)
+                if indices.dtype == bool:
+                    indices = np.flatnonzero(indices)
             ret = list()
             for i in indices:
                 ret.append(self.__getitem_helper(i, **kwargs))
@@ -245,7 +301,7 @@ class ElementIdentifiers(Data):
         if isinstance(search_ids, int):
             search_ids = [search_ids]
         # Find all matching locations
-        return np.in1d(self.data, search_ids).nonzero()[0]
+        return np.flatnonzero(np.isin(self.data, search_ids))
 
 
 @register_class('DynamicTable')
@@ -290,9 +346,8 @@ class DynamicTable(Container):
 
         if (len(bases) and 'DynamicTable' in globals() and issubclass(bases[-1], Container)
                 and bases[-1].__columns__ is not cls.__columns__):
-            new_columns = list(cls.__columns__)
-            new_columns[0:0] = bases[-1].__columns__  # prepend superclass columns to new_columns
-            cls.__columns__ = tuple(new_columns)
+            # prepend superclass columns to the columns defined in this class
+            cls.__columns__ = bases[-1].__columns__ + cls.__columns__
 
     @docval({'name': 'name', 'type': str, 'doc': 'the name of this table'},  # noqa: C901
             {'name': 'description', 'type': str, 'doc': 'a description of what is in this table'},
@@ -357,7 +412,7 @@ class DynamicTable(Container):
                 if isinstance(_data, AbstractDataChunkIterator):
                     colset.pop(c.name, None)
             lens = [len(c) for c in colset.values()]
-            if not all(i == lens[0] for i in lens):
+            if len(set(lens)) > 1:
                 raise ValueError("columns must be the same length")
             if len(lens) > 0 and lens[0] != len(id):
                 # the first part of this conditional is needed in the
@@ -368,6 +423,10 @@ class DynamicTable(Container):
                     id.data.extend(range(lens[0]))
 
         self.id = id
+        # set of the ids in self.id, built on first use by __has_id and then updated as ids are added
+        self.__id_set = None
+        self.__id_set_source = None
+        self.__id_set_len = 0
 
         # NOTE: self.colnames and self.columns are always tuples
         # if kwarg colnames is an h5dataset, self.colnames is still a tuple
@@ -536,15 +595,10 @@ class DynamicTable(Container):
                                      'add_column or define the columns using __columns__ instead.')
                 index_data = None
                 if data is not None:
-                    index_data = [len(data[0])]
-                    for i in range(1, len(data)):
-                        index_data.append(len(data[i]) + index_data[i - 1])
+                    index_data = list(itertools.accumulate(len(d) for d in data))
                     # assume data came in through a DataFrame, so we need
                     # to concatenate it
-                    tmp_data = list()
-                    for d in data:
-                        tmp_data.extend(d)
-                    data = tmp_data
+                    data = list(itertools.chain.from_iterable(data))
                 vdata = col_cls(name=name, description=desc, data=data)
                 vindex = VectorIndex(name="%s_index" % name, data=index_data, target=vdata)
                 tmp.append(vindex)
@@ -553,6 +607,9 @@ class DynamicTable(Container):
                 # EnumData is the indexing column, so it should go first
                 if data is not None:
                     elements, data = np.unique(data, return_inverse=True)
+                    if len(elements) > 0:
+                        # store the indices with the smallest uint precision needed, as EnumData.add_row does
+                        data = data.astype(_uint_precision(elements))
                     tmp.append(EnumData(name, desc, data=data, elements=elements))
                 else:
                     tmp.append(EnumData(name, desc, data=data))
@@ -583,22 +640,17 @@ class DynamicTable(Container):
         data, row_id, enforce_unique_id = popargs('data', 'id', 'enforce_unique_id', kwargs)
         data = data if data is not None else kwargs
 
-        extra_columns = set(list(data.keys())) - set(list(self.__colids.keys()))
-        missing_columns = set(list(self.__colids.keys())) - set(list(data.keys()))
+        extra_columns = data.keys() - self.__colids.keys()
+        missing_columns = self.__colids.keys() - data.keys()
 
         bad_data = []
         for colname, colnum in self.__colids.items():
             if colname not in data:
                 raise ValueError("column '%s' missing" % colname)
-            col = self.__df_cols[colnum]
-            if isinstance(col, VectorIndex):
-                continue
-            else:
-                if col.term_set is not None:
-                    if col.term_set.validate(term=data[colname]):
-                        continue
-                    else:
-                        bad_data.append(data[colname])
+            # VectorIndex columns never have a term_set; the values of their target are validated on add_vector
+            term_set = self.__df_cols[colnum].term_set
+            if term_set is not None and not term_set.validate(term=data[colname]):
+                bad_data.append(data[colname])
 
         if len(bad_data)!=0:
             msg = ('"%s" is not in the term set.' % ', '.join([str(item) for item in bad_data]))
@@ -606,52 +658,183 @@ class DynamicTable(Container):
 
         # check to see if any of the extra columns just need to be added
         if extra_columns:
-            for col in self.__columns__:
-                if col['name'] in extra_columns:
-                    if data[col['name']] is not None:
-                        self.add_column(col['name'], col['description'],
-                                        index=col.get('index', False),
-                                        table=col.get('table', False),
-                                        enum=col.get('enum', False),
-                                        col_cls=col.get('class', VectorData),
-                                        # Pass through extra keyword arguments for add_column that
-                                        # subclasses may have added
-                                        **{k: col[k] for k in col.keys()
-                                           if k not in DynamicTable.__reserved_colspec_keys})
-                    extra_columns.remove(col['name'])
+            self.__add_predefined_columns(extra_columns, data)
 
         if extra_columns or missing_columns:
-            raise ValueError(
-                '\n'.join([
-                    'row data keys don\'t match available columns',
-                    'you supplied {} extra keys: {}'.format(len(extra_columns), extra_columns),
-                    'and were missing {} keys: {}'.format(len(missing_columns), missing_columns)
-                ])
-            )
+            self.__raise_mismatched_columns(extra_columns, missing_columns)
         if row_id is None:
             row_id = data.pop('id', None)
         if row_id is None:
             row_id = len(self)
         if enforce_unique_id:
-            if row_id in self.id:
+            if row_id in self.__get_id_set():
                 raise ValueError("id %i already in the table" % row_id)
         self.id.append(row_id)
 
+        # all columns were checked to be present in data above
         for colname, colnum in self.__colids.items():
-            if colname not in data:
-                raise ValueError("column '%s' missing" % colname)
             c = self.__df_cols[colnum]
             if isinstance(c, VectorIndex):
                 c.add_vector(data[colname])
+            elif type(c) is VectorData and c.term_set is None:
+                # append to plain columns directly to avoid the overhead of the docval'd add_row for every column
+                c.append(data[colname])
             else:
                 c.add_row(data[colname])
 
+    @docval({'name': 'data', 'type': (dict, list, tuple),
+             'doc': ('a dict mapping each column name to the values of that column for the rows to add, or a '
+                     'list of dicts, one per row, as would be passed to add_row')},
+            {'name': 'id', 'type': ('array_data', 'data'), 'doc': 'the IDs for the rows', 'default': None},
+            {'name': 'enforce_unique_id', 'type': bool, 'doc': 'enforce that the ids in the table must be unique',
+             'default': False})
+    def add_rows(self, **kwargs):
+        """
+        Add multiple rows to the table. If *id* is not provided, it will auto-increment.
+
+        This is equivalent to calling :py:meth:`add_row` for each row, but each column is extended only once. The
+        ids, the column names and lengths, the nesting of the values of ragged columns, and the values that are
+        validated against a term set, including those added to the target of a ragged column, are checked before
+        the table is modified.
+        """
+        data, row_ids, enforce_unique_id = getargs('data', 'id', 'enforce_unique_id', kwargs)
+        if not isinstance(data, dict):
+            if len(data) == 0:
+                return
+            data = self.__rows_to_columns(data)
+
+        extra_columns = data.keys() - self.__colids.keys()
+        missing_columns = self.__colids.keys() - data.keys()
+        predefined = {col['name'] for col in self.__columns__}
+        if extra_columns - predefined or missing_columns:
+            self.__raise_mismatched_columns(extra_columns - predefined, missing_columns)
+
+        for colname, values in data.items():
+            if (colname in self.__colids or values is not None) and \
+                    (not hasattr(values, '__len__') or isinstance(values, (str, bytes))):
+                raise ValueError("the values of column '%s' must be a list or array, not %s"
+                                 % (colname, type(values).__name__))
+        lens = {len(values) for colname, values in data.items()
+                if colname in self.__colids or values is not None}
+        if len(lens) > 1:
+            raise ValueError("columns must be the same length")
+        num_rows = lens.pop() if lens else 0
+        if row_ids is None:
+            row_ids = range(len(self), len(self) + num_rows)
+        elif len(row_ids) != num_rows:
+            raise ValueError("must provide same number of ids as length of columns")
+        if enforce_unique_id:
+            if len(set(row_ids)) != len(row_ids) or not self.__get_id_set().isdisjoint(row_ids):
+                raise ValueError("ids are not unique in the table")
+
+        # check the values of ragged columns and of columns with a term set here, because a failure while extending
+        # the columns would leave the table corrupted
+        predefined_index = {col['name']: col.get('index', False) for col in self.__columns__}
+        bad_data = []
+        for colname, values in data.items():
+            term_set = None
+            if colname in self.__colids:
+                col = self.__df_cols[self.__colids[colname]]
+                depth = 0
+                while isinstance(col, VectorIndex):
+                    depth += 1
+                    col = col.target
+                term_set = col.term_set
+            elif values is not None:
+                depth = int(predefined_index[colname])
+            else:
+                continue
+            if depth > 0:
+                self.__check_ragged_cells(colname, values, depth)
+            if term_set is not None:
+                for _ in range(depth):  # validate the values of the target of a ragged column
+                    values = list(itertools.chain.from_iterable(values))
+                valid = term_set.validate_many(values)
+                bad_data.extend(val for val, is_valid in zip(values, valid) if not is_valid)
+        if len(bad_data) != 0:
+            msg = ('"%s" is not in the term set.' % ', '.join([str(item) for item in bad_data]))
+            raise ValueError(msg)
+
+        if extra_columns:
+            self.__add_predefined_columns(set(extra_columns), data)
+
+        if num_rows == 0:
+            return
+        self.id.extend(row_ids)
+        for colname, colnum in self.__colids.items():
+            self.__df_cols[colnum].extend(data[colname])
+
+    def __get_id_set(self):
+        """
+        Get the set of the ids in the table, used to check that new ids are unique in O(1) per id.
+
+        The set is rebuilt if the data of self.id was replaced or shrunk. Otherwise, only the ids appended since the
+        last call are added to it.
+        """
+        ids = self.id.data
+        if self.__id_set is None or self.__id_set_source is not ids or len(ids) < self.__id_set_len:
+            self.__id_set = set()
+            self.__id_set_source = ids
+            self.__id_set_len = 0
+        if len(ids) > self.__id_set_len:
+            self.__id_set.update(self.id[self.__id_set_len:])
+            self.__id_set_len = len(ids)
+        return self.__id_set
+
+    @staticmethod
+    def __check_ragged_cells(colname, cells, depth):
+        """Check that each cell of a ragged column, and each nested cell up to the given depth, is a sized iterable"""
+        for cell in cells:
+            if not (hasattr(cell, '__len__') and hasattr(cell, '__iter__')):
+                raise ValueError("column '%s' is ragged, so each of its values must be a list or array, not %s"
+                                 % (colname, type(cell).__name__))
+            if depth > 1:
+                DynamicTable.__check_ragged_cells(colname, cell, depth - 1)
+
+    @staticmethod
+    def __rows_to_columns(rows):
+        """Convert a list of dicts, one per row, to a dict mapping each column name to a list of values"""
+        colnames = rows[0].keys()
+        for row in rows:
+            if row.keys() != colnames:
+                raise ValueError("all rows must have the same keys")
+        return {colname: [row[colname] for row in rows] for colname in colnames}
+
+    def __add_predefined_columns(self, extra_columns, data):
+        """
+        Add the optional columns defined in __columns__ that are in extra_columns and have data that is not None.
+        These columns are removed from the set extra_columns.
+        """
+        for col in self.__columns__:
+            if col['name'] in extra_columns:
+                if data[col['name']] is not None:
+                    self.add_column(col['name'], col['description'],
+                                    index=col.get('index', False),
+                                    table=col.get('table', False),
+                                    enum=col.get('enum', False),
+                                    col_cls=col.get('class', VectorData),
+                                    # Pass through extra keyword arguments for add_column that
+                                    # subclasses may have added
+                                    **{k: col[k] for k in col.keys()
+                                       if k not in DynamicTable.__reserved_colspec_keys})
+                extra_columns.remove(col['name'])
+
+    @staticmethod
+    def __raise_mismatched_columns(extra_columns, missing_columns):
+        raise ValueError(
+            '\n'.join([
+                'row data keys don\'t match available columns',
+                'you supplied {} extra keys: {}'.format(len(extra_columns), extra_columns),
+                'and were missing {} keys: {}'.format(len(missing_columns), missing_columns)
+            ])
+        )
+
     def __eq__(self, other):
         """Compare if the two DynamicTables contain the same data.
 
-        First this returns False if the other DynamicTable has a different name or
-        description. Then, this table and the other table are converted to pandas
-        dataframes and the equality of the two tables is returned.
+        First this returns False if the other DynamicTable has a different name,
+        description, number of rows, or column names. Then, this table and the other
+        table are converted to pandas dataframes and the equality of the two tables is returned.
 
         :param other: DynamicTable to compare to
 
@@ -663,6 +846,9 @@ class DynamicTable(Container):
             return False
         if self.name != other.name or self.description != other.description:
             return False
+        # the dataframes would differ in their index or columns, so avoid converting the tables
+        if len(self) != len(other) or tuple(self.colnames) != tuple(other.colnames):
+            return False
         return self.to_dataframe().equals(other.to_dataframe())
 
     @docval({'name': 'name', 'type': str, 'doc': 'the name of this VectorData'},  # noqa: C901
@@ -701,12 +887,8 @@ class DynamicTable(Container):
         index, table, enum, col_cls, term_set= popargs('index', 'table', 'enum', 'col_cls', 'term_set', kwargs)
 
         if term_set is not None:
-            bad_data = []
-            for val in data:
-                if term_set.validate(term=val):
-                    continue
-                else:
-                    bad_data.append(val)
+            valid = term_set.validate_many(data)
+            bad_data = [val for val, is_valid in zip(data, valid) if not is_valid]
             if len(bad_data)!=0:
                 bad_data_string = str(bad_data)[1:-1]
                 msg = ("%s is not in the term set." % bad_data_string)
@@ -854,8 +1036,8 @@ class DynamicTable(Container):
         if len(col) != len(self.id):
             raise ValueError("column must have the same number of rows as 'id'")
         self.__colids[name] = len(self.__df_cols)
-        self.fields['colnames'] = tuple(list(self.colnames) + [name])
-        self.fields['columns'] = tuple(list(self.columns) + columns)
+        self.fields['colnames'] = self.colnames + (name,)
+        self.fields['columns'] = self.columns + tuple(columns)
         self.__df_cols.append(col)
 
     def __add_column_index_helper(self, col_index):
@@ -884,11 +1066,13 @@ class DynamicTable(Container):
                 raise IndexError(msg)
             region = list(range(*region.indices(len(self))))
         else:
-            for idx in region:
-                if idx < 0 or idx >= len(self):
-                    raise IndexError('The index ' + str(idx) +
-                                     ' is out of range for this DynamicTable of length '
-                                     + str(len(self)))
+            # check all indices at once and report the first invalid one
+            arr = np.asarray(region)
+            bad = np.flatnonzero((arr < 0) | (arr >= len(self)))
+            if len(bad) > 0:
+                raise IndexError('The index ' + str(region[bad[0]]) +
+                                 ' is out of range for this DynamicTable of length '
+                                 + str(len(self)))
         desc = getargs('description', kwargs)
         name = getargs('name', kwargs)
         return DynamicTableRegion(name=name, data=region, description=desc, table=self)
@@ -1056,10 +1240,12 @@ class DynamicTable(Container):
             elif isinstance(coldata[k], pd.DataFrame):
                 # multiple rows were selected and collapsed into a dataframe
                 # split up the rows of the df into a list of dataframes, one per row
-                # TODO make this more efficient
-                df_input[k] = [coldata[k].iloc[[i]] for i in range(len(coldata[k]))]
+                # slicing is much cheaper than indexing with a list because it does not copy the row
+                df_input[k] = [coldata[k].iloc[i:i+1] for i in range(len(coldata[k]))]
             else:
                 df_input[k] = coldata[k]
+        # convert the ids with numpy first; pd.Index casting a long list of ints to int64 itself is much slower
+        id_index = np.asarray(id_index, dtype=np.int64)
         ret = pd.DataFrame(df_input, index=pd.Index(name=self.id.name, data=id_index, dtype=np.int64))
         ret.name = self.name
         return ret
@@ -1119,6 +1305,7 @@ class DynamicTable(Container):
         other_tables = getargs('other_tables', kwargs)
         if other_tables is not None:
             curr_tables += other_tables
+        visited = {id(t) for t in curr_tables}  # ids of the tables in curr_tables for constant-time lookup
         curr_index = 0
         foreign_cols = []
         while curr_index < len(curr_tables):
@@ -1127,11 +1314,8 @@ class DynamicTable(Container):
                     foreign_cols.append(link_type(source_table=curr_tables[curr_index],
                                                   source_column=col,
                                                   target_table=col.table))
-                    curr_table_visited = False
-                    for t in curr_tables:
-                        if t is col.table:
-                            curr_table_visited = True
-                    if not curr_table_visited:
+                    if id(col.table) not in visited:
+                        visited.add(id(col.table))
                         curr_tables.append(col.table)
             curr_index += 1
         return foreign_cols
@@ -1207,10 +1391,13 @@ class DynamicTable(Container):
         class_cols = {x['name']: x for x in cls.__columns__}
         required_cols = set(x['name'] for x in cls.__columns__ if 'required' in x and x['required'])
         df_cols = df.columns
-        if required_cols - set(df_cols):
-            raise ValueError('missing required cols: ' + str(required_cols - set(df_cols)))
-        if set(supplied_columns.keys()) - set(df_cols):
-            raise ValueError('cols specified but not provided: ' + str(set(supplied_columns.keys()) - set(df_cols)))
+        df_col_set = set(df_cols)
+        missing_cols = required_cols - df_col_set
+        if missing_cols:
+            raise ValueError('missing required cols: ' + str(missing_cols))
+        missing_cols = supplied_columns.keys() - df_col_set
+        if missing_cols:
+            raise ValueError('cols specified but not provided: ' + str(missing_cols))
         columns = []
         for col_name in df_cols:
             if col_name in class_cols:
@@ -1220,9 +1407,11 @@ class DynamicTable(Container):
             else:
                 columns.append({'name': col_name,
                                 'description': column_descriptions.get(col_name, 'no description')})
-                if hasattr(df[col_name].iloc[0], '__len__') and not isinstance(df[col_name].iloc[0], str):
-                    lengths = [len(x) for x in df[col_name]]
-                    if not lengths[1:] == lengths[:-1]:
+                values = df[col_name].values
+                first_val = values[0]
+                if hasattr(first_val, '__len__') and not isinstance(first_val, str):
+                    lengths = np.fromiter((len(x) for x in values), dtype=np.intp, count=len(values))
+                    if lengths.min() != lengths.max():
                         columns[-1].update(index=True)
 
         if index_column is not None:
@@ -1326,19 +1515,21 @@ class DynamicTableRegion(VectorData):
             raise ValueError('DynamicTableRegion.get() with df=False and index=False is not yet supported.')
         # treat the list of indices as data that can be indexed. then pass the
         # result to the table to get the data
-        if isinstance(arg, tuple):
-            arg1 = arg[0]
-            arg2 = arg[1]
-            return self.table[self.data[arg1], arg2]
-        elif isinstance(arg, str):
-            return self.table[arg]
-        elif np.issubdtype(type(arg), np.integer):
+        # check for a single integer first as it is the most common case, e.g., when iterating.
+        # isinstance is much cheaper than np.issubdtype. bool is a subclass of int but is not a valid index
+        if isinstance(arg, (int, np.integer)) and not isinstance(arg, bool):
             if arg >= len(self.data):
                 raise IndexError('index {} out of bounds for data of length {}'.format(arg, len(self.data)))
             ret = self.data[arg]
             if not index:
                 ret = self.table.get(ret, df=df, index=index, **kwargs)
             return ret
+        elif isinstance(arg, tuple):
+            arg1 = arg[0]
+            arg2 = arg[1]
+            return self.table[self.data[arg1], arg2]
+        elif isinstance(arg, str):
+            return self.table[arg]
         elif isinstance(arg, (list, slice, np.ndarray)):
             idx = arg
 
@@ -1358,35 +1549,44 @@ class DynamicTableRegion(VectorData):
                 #
                 # When not returning a DataFrame, we need to recursively sort the subelements
                 # of the list we are returning. This is carried out by the recursive method _index_lol
-                uniq = np.unique(ret)
-                lut = {val: i for i, val in enumerate(uniq)}
+                #
+                # If the indices are already sorted and unique (e.g., the region is a range of rows), they can be
+                # passed to the table as is and no reordering is needed.
+                ret_arr = np.asarray(ret)
+                if ret_arr.ndim == 1 and len(ret_arr) > 0 and np.all(ret_arr[1:] > ret_arr[:-1]):
+                    return self.table.get(ret_arr, df=df, index=index, **kwargs)
+                uniq, inverse = np.unique(ret, return_inverse=True)
                 values = self.table.get(uniq, df=df, index=index, **kwargs)
+                # inverse gives the position in uniq of each element of ret
                 if df:
-                    ret = values.iloc[[lut[i] for i in ret]]
+                    ret = values.iloc[inverse]
                 else:
-                    ret = self._index_lol(values, ret, lut)
+                    ret = self._index_lol(values, inverse)
             return ret
         else:
             raise ValueError("unrecognized argument: '%s'" % arg)
 
-    def _index_lol(self, result, index, lut):
+    def _index_lol(self, result, pos):
         """
         This is a helper function for indexing a list of lists/ndarrays. When not returning a
         DataFrame, indexing a DynamicTable will return a list of lists and ndarrays. To sort
         the result of a DynamicTable index according to the order of the indices passed in by the
         user, we have to recursively sort the sub-lists/sub-ndarrays.
+
+        :param result: The list of columns returned by indexing the DynamicTable with the sorted unique indices
+        :param pos: Array with the position in the sorted unique indices of each index passed in by the user
         """
         ret = list()
         for col in result:
             if isinstance(col, list):
                 if isinstance(col[0], list):
                     # list of columns that need to be sorted
-                    ret.append(self._index_lol(col, index, lut))
+                    ret.append(self._index_lol(col, pos))
                 else:
                     # list of elements, one for each row to return
-                    ret.append([col[lut[i]] for i in index])
+                    ret.append([col[i] for i in pos])
             elif isinstance(col, np.ndarray):
-                ret.append(np.array([col[lut[i]] for i in index], dtype=col.dtype))
+                ret.append(col[pos])
             else:
                 raise ValueError('unrecognized column type: %s. Expected list or np.ndarray' % type(col))
         return ret
@@ -1399,7 +1599,10 @@ class DynamicTableRegion(VectorData):
         is being referenced (i.e., self.table). This allows specification of the 'exclude'
         parameter and any other parameters of DynamicTable.to_dataframe.
         """
-        return self.table.to_dataframe(**kwargs).iloc[self.data[:]]
+        # select only the referenced rows of the table rather than converting the whole table
+        uniq, inverse = np.unique(np.asarray(self.data[:], dtype=np.int64), return_inverse=True)
+        index = kwargs.pop('index', False)  # the default of DynamicTable.to_dataframe
+        return self.table.get(uniq, df=True, index=index, **kwargs).iloc[inverse]
 
     @property
     def shape(self):
@@ -1427,7 +1630,14 @@ def _uint_precision(elements):
     n_elements = elements
     if hasattr(elements, '__len__'):
         n_elements = len(elements)
-    return np.dtype('uint%d' % (8 * max(1, int((2 ** np.ceil((np.ceil(np.log2(n_elements)) - 8) / 8)))))).type
+    # the largest index is n_elements - 1
+    if n_elements <= 1 << 8:
+        return np.uint8
+    if n_elements <= 1 << 16:
+        return np.uint16
+    if n_elements <= 1 << 32:
+        return np.uint32
+    return np.uint64
 
 
 def _map_elements(uint, elements):
@@ -1482,8 +1692,15 @@ class EnumData(VectorData):
                 # remap terms to their uint and bump the precision of existing data
                 self.__uint = uint
                 self.__revidx = _map_elements(self.__uint, self.elements)
-                for i in range(len(self.data)):
-                    self.data[i] = self.__uint(self.data[i])
+                if isinstance(self.data, list):
+                    # cast all values at once and update the list in place to keep the list type and identity
+                    self.data[:] = list(np.asarray(self.data, dtype=self.__uint))
+                elif isinstance(self.data, np.ndarray):
+                    # use self._Data__data to work around restriction on resetting self.data
+                    self._Data__data = self.data.astype(self.__uint)
+                else:
+                    for i in range(len(self.data)):
+                        self.data[i] = self.__uint(self.data[i])
         return self.__revidx[term]
 
     def __getitem__(self, arg):
@@ -1500,7 +1717,11 @@ class EnumData(VectorData):
             return idx
         if not np.isscalar(idx):
             idx = np.asarray(idx)
-            ret = np.asarray(self.elements.get(idx.ravel(), **kwargs)).reshape(idx.shape)
+            if isinstance(self.elements.data, np.ndarray):
+                # fancy indexing of the elements array directly returns an array with the shape of idx
+                ret = self.elements.data[idx]
+            else:
+                ret = np.asarray(self.elements.get(idx.ravel(), **kwargs)).reshape(idx.shape)
             if join:
                 ret = ''.join(ret.ravel())
         else:
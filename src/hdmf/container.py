@@ -1,6 +1,5 @@
 import types
 from abc import abstractmethod
-from collections import OrderedDict
 from copy import deepcopy
 from uuid import uuid4
 from warnings import warn
@@ -98,7 +97,7 @@ class AbstractContainer(metaclass=ExtenderMeta):
         name = field['name']
 
         def getter(self):
-            return self.fields.get(name)
+            return self.__field_values.get(name)
 
         setattr(getter, '__doc__', doc)
         return getter
@@ -149,7 +148,7 @@ class AbstractContainer(metaclass=ExtenderMeta):
             raise TypeError(msg)
 
         # check field specs and create map from field name to field conf dictionary
-        fields_dict = OrderedDict()
+        fields_dict = dict()
         for f in fields:
             pconf = cls._check_field_spec(f)
             cls._check_field_spec_keys(pconf)
@@ -211,8 +210,9 @@ class AbstractContainer(metaclass=ExtenderMeta):
         inst.__container_source = kwargs.pop('container_source', None)
         inst.__parent = None
         inst.__children = list()
+        inst.__children_tuple = tuple()  # snapshot of the children returned by the children property
         inst.__modified = True
-        inst.__object_id = kwargs.pop('object_id', str(uuid4()))
+        inst.__object_id = kwargs.pop('object_id', None)  # generated on first access of object_id
         # this variable is being passed in from ObjectMapper.__new_container__ and is
         # reset to False in that method after the object has been initialized by __init__
         inst._in_construct_mode = kwargs.pop('in_construct_mode', False)
@@ -318,6 +318,12 @@ class AbstractContainer(metaclass=ExtenderMeta):
             self.__object_id = str(uuid4())
         return self.__object_id
 
+    def __getstate__(self):
+        # generate the object ID, if not yet generated, so that copies and unpickled objects share it
+        if self.__object_id is None:
+            self.__object_id = str(uuid4())
+        return self.__dict__
+
     @docval({'name': 'recurse', 'type': bool,
              'doc': "whether or not to change the object ID of this container's children", 'default': True})
     def generate_new_id(self, **kwargs):
@@ -338,12 +344,18 @@ class AbstractContainer(metaclass=ExtenderMeta):
     def set_modified(self, **kwargs):
         modified = getargs('modified', kwargs)
         self.__modified = modified
-        if modified and isinstance(self.parent, Container):
-            self.parent.set_modified()
+        if modified:
+            # mark all ancestors as modified in a loop rather than calling the docval'd set_modified on each
+            parent = self.parent
+            while isinstance(parent, Container):
+                parent.__modified = True
+                parent = parent.parent
 
     @property
     def children(self):
-        return tuple(self.__children)
+        if self.__children_tuple is None:
+            self.__children_tuple = tuple(self.__children)
+        return self.__children_tuple
 
     @docval({'name': 'child', 'type': 'Container',
              'doc': 'the child Container for this Container', 'default': None})
@@ -387,28 +399,31 @@ class AbstractContainer(metaclass=ExtenderMeta):
 
     @parent.setter
     def parent(self, parent_container):
-        if self.parent is parent_container:
+        current = self.parent
+        if current is parent_container:
             return
 
-        if self.parent is not None:
-            if isinstance(self.parent, AbstractContainer):
+        if current is not None:
+            if isinstance(current, AbstractContainer):
                 raise ValueError(('Cannot reassign parent to Container: %s. '
-                                  'Parent is already: %s.' % (repr(self), repr(self.parent))))
+                                  'Parent is already: %s.' % (repr(self), repr(current))))
             else:
                 if parent_container is None:
                     raise ValueError("Got None for parent of '%s' - cannot overwrite Proxy with NoneType" % repr(self))
                 # NOTE this assumes isinstance(parent_container, Proxy) but we get a circular import
                 # if we try to do that
-                if self.parent.matches(parent_container):
+                if current.matches(parent_container):
                     self.__parent = parent_container
                     parent_container.__children.append(self)
+                    parent_container.__children_tuple = None
                     parent_container.set_modified()
                 else:
-                    self.__parent.add_candidate(parent_container)
+                    current.add_candidate(parent_container)
         else:
             self.__parent = parent_container
             if isinstance(parent_container, Container):
                 parent_container.__children.append(self)
+                parent_container.__children_tuple = None
                 parent_container.set_modified()
             for child in self.children:
                 if type(child).__name__ == "DynamicTableRegion":
@@ -422,11 +437,14 @@ class AbstractContainer(metaclass=ExtenderMeta):
         """Remove a child Container. Intended for use in subclasses that allow dynamic addition of child Containers."""
         if not isinstance(child, AbstractContainer):
             raise ValueError('Cannot remove non-AbstractContainer object from children.')
-        if child not in self.children:
+        # look up children by identity. comparing with == could be expensive, e.g., for DynamicTable
+        index = next((i for i, c in enumerate(self.__children) if c is child), None)
+        if index is None:
             raise ValueError("%s '%s' is not a child of %s '%s'." % (child.__class__.__name__, child.name,
                                                                      self.__class__.__name__, self.name))
         child.__parent = None
-        self.__children.remove(child)
+        del self.__children[index]
+        self.__children_tuple = None
         child.set_modified()
         self.set_modified()
 
@@ -651,7 +669,7 @@ class Container(AbstractContainer):
         elif isinstance(v, dict):
             return Container.__smart_str_dict(v, num_indent)
         elif isinstance(v, set):
-            return Container.__smart_str_list(sorted(list(v)), num_indent, '{')
+            return Container.__smart_str_list(sorted(v), num_indent, '{')
         elif isinstance(v, AbstractContainer):
             return "{} {}".format(getattr(v, 'name'), type(v))
         else:
@@ -666,14 +684,9 @@ class Container(AbstractContainer):
         if len(str_list) == 0:
             return left_br + ' ' + right_br
         indent = num_indent * 2 * ' '
-        indent_in = (num_indent + 1) * 2 * ' '
-        out = left_br
-        for v in str_list[:-1]:
-            out += '\n' + indent_in + Container.__smart_str(v, num_indent + 1) + ','
-        if str_list:
-            out += '\n' + indent_in + Container.__smart_str(str_list[-1], num_indent + 1)
-        out += '\n' + indent + right_br
-        return out
+        sep = '\n' + indent + '  '
+        items = [Container.__smart_str(v, num_indent + 1) for v in str_list]
+        return left_br + sep + (',' + sep).join(items) + '\n' + indent + right_br
 
     @staticmethod
     def __smart_str_dict(d, num_indent):
@@ -682,15 +695,9 @@ class Container(AbstractContainer):
         if len(d) == 0:
             return left_br + ' ' + right_br
         indent = num_indent * 2 * ' '
-        indent_in = (num_indent + 1) * 2 * ' '
-        out = left_br
-        keys = sorted(list(d.keys()))
-        for k in keys[:-1]:
-            out += '\n' + indent_in + Container.__smart_str(k, num_indent + 1) + ' ' + str(type(d[k])) + ','
-        if keys:
-            out += '\n' + indent_in + Container.__smart_str(keys[-1], num_indent + 1) + ' ' + str(type(d[keys[-1]]))
-        out += '\n' + indent + right_br
-        return out
+        sep = '\n' + indent + '  '
+        items = ['%s %s' % (Container.__smart_str(k, num_indent + 1), type(d[k])) for k in sorted(d)]
+        return left_br + sep + (',' + sep).join(items) + '\n' + indent + right_br
 
 
 class Data(AbstractContainer):
@@ -707,18 +714,8 @@ class Data(AbstractContainer):
         self.term_set = popargs('term_set', kwargs)
         super().__init__(**kwargs)
         if self.term_set is not None:
-            bad_data = [term for term in data if not  self.term_set.validate(term=term)]
-            for term in data:
-                if self.term_set.validate(term=term):
-                    continue
-                else:
-                    bad_data.append(term)
-            if len(bad_data)!=0:
-                msg = ('"%s" is not in the term set.' % ', '.join([str(item) for item in bad_data]))
-                raise ValueError(msg)
-            self.__data = data
-        else:
-            self.__data = data
+            self.__validate_terms(data)
+        self.__data = data
 
     @property
     def data(self):
@@ -731,7 +728,10 @@ class Data(AbstractContainer):
         :return: Shape tuple
         :rtype: tuple of ints
         """
-        return get_data_shape(self.__data)
+        data = self.__data
+        if type(data) is np.ndarray:
+            return data.shape
+        return get_data_shape(data)
 
     @docval({'name': 'dataio', 'type': DataIO, 'doc': 'the DataIO to apply to the data held by this Data'})
     def set_dataio(self, **kwargs):
@@ -755,10 +755,11 @@ class Data(AbstractContainer):
         return self
 
     def __bool__(self):
-        if self.data is not None:
-            if isinstance(self.data, (np.ndarray, tuple, list)):
-                return len(self.data) != 0
-            if self.data:
+        data = self.data
+        if data is not None:
+            if isinstance(data, (np.ndarray, tuple, list)):
+                return len(data) != 0
+            if data:
                 return True
         return False
 
@@ -793,18 +794,17 @@ class Data(AbstractContainer):
 
         :param arg: The iterable to add to the end of this VectorData
         """
-        if self.term_set is None:
-            self.__data = extend_data(self.__data, arg)
-        else:
-            bad_data = []
-            for item in arg:
-                try:
-                    self.append(item)
-                except ValueError:
-                    bad_data.append(item)
-            if len(bad_data)!=0:
-                msg = ('"%s" is not in the term set.' % ', '.join([str(item) for item in bad_data]))
-                raise ValueError(msg)
+        if self.term_set is not None:
+            self.__validate_terms(arg)
+        self.__data = extend_data(self.__data, arg)
+
+    def __validate_terms(self, terms):
+        """Raise a ValueError listing all of the given terms that are not in self.term_set"""
+        valid = self.term_set.validate_many(terms)
+        if not valid.all():
+            bad_data = [term for term, is_valid in zip(terms, valid) if not is_valid]
+            msg = ('"%s" is not in the term set.' % ', '.join([str(item) for item in bad_data]))
+            raise ValueError(msg)
 
 
 class DataRegion(Data):
@@ -1024,13 +1024,15 @@ class MultiContainerInterface(Container):
             # initialize the field to an empty labeled dict if it has not yet been
             # do this here to avoid creating default __init__ which may or may not be overridden in
             # custom classes and dynamically generated classes
-            if attr not in self.fields:
+            fields = self.fields
+            ret = fields.get(attr)
+            if ret is None:
                 def _remove_child(child):
                     if child.parent is self:
                         self._remove_child(child)
-                self.fields[attr] = LabelledDict(attr, remove_callable=_remove_child)
+                ret = fields[attr] = LabelledDict(attr, remove_callable=_remove_child)
 
-            return self.fields.get(attr)
+            return ret
 
         return _func
 
@@ -1065,13 +1067,13 @@ class MultiContainerInterface(Container):
             raise TypeError("'__clsconf__' for MultiContainerInterface subclass %s must be a dict or a list of "
                             "dicts." % cls.__name__)
 
-        for conf_index, conf_dict in enumerate(clsconf):
-            cls.__build_conf_methods(conf_dict, conf_index, multi)
+        built_confs = [cls.__build_conf_methods(conf_dict, conf_index, multi)
+                       for conf_index, conf_dict in enumerate(clsconf)]
 
         # make __getitem__ (square bracket access) only if one conf type is defined
-        if len(clsconf) == 1:
-            attr = clsconf[0].get('attr')
-            container_type = clsconf[0].get('type')
+        # and only if it has not been overridden in this class
+        if len(built_confs) == 1 and '__getitem__' not in cls.__dict__:
+            attr, container_type = built_confs[0]
             setattr(cls, '__getitem__', cls.__make_getitem(attr, container_type))
 
         # create the constructor, only if it has not been overridden
@@ -1081,6 +1083,7 @@ class MultiContainerInterface(Container):
 
     @classmethod
     def __build_conf_methods(cls, conf_dict, conf_index, multi):
+        """Create the methods for one __clsconf__ entry and return its validated (attr, type) pair."""
         # get add method name
         add = conf_dict.get('add')
         if add is None:
@@ -1132,6 +1135,8 @@ class MultiContainerInterface(Container):
         if get is not None:
             setattr(cls, get, cls.__make_get(get, attr, container_type))
 
+        return attr, container_type
+
 
 class Row(object, metaclass=ExtenderMeta):
     """
@@ -39,6 +39,8 @@ def extend_data(data, arg):
         data.extend(arg)
         return data
     elif isinstance(data, np.ndarray):
+        if data.ndim == 1:
+            return np.concatenate((data, arg))
         return np.vstack((data, arg))
     elif isinstance(data, h5py.Dataset):
         shape = list(data.shape)
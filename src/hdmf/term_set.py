@@ -1,4 +1,6 @@
 from collections import namedtuple
+import numpy as np
+
 from .utils import docval
 
 
@@ -26,6 +28,7 @@ class TermSet():
         self.term_schema_path = term_schema_path
         self.view = SchemaView(self.term_schema_path)
         self.sources = self.view.schema.prefixes
+        self.__terms = None  # set of all terms in the term set, computed on first use by validate_many
 
     def __repr__(self):
         re = "class: %s\n" % str(self.__class__)
@@ -65,6 +68,24 @@ class TermSet():
         except ValueError:
             return False
 
+    @docval({'name': 'terms', 'type': 'array_data', 'doc': "terms to be validated"},
+            returns='a boolean array indicating for each term whether it is in the term set', rtype=np.ndarray)
+    def validate_many(self, **kwargs):
+        """
+        Validate multiple terms in a dataset towards a termset.
+        """
+        terms = kwargs['terms']
+        if self.__terms is None:
+            enumeration = list(self.view.all_enums())[0]
+            self.__terms = frozenset(self.view.all_enums()[enumeration].permissible_values)
+        valid = np.empty(len(terms), dtype=bool)
+        for i, term in enumerate(terms):
+            if not isinstance(term, str):  # consistent with the docval type check of validate
+                raise TypeError("TermSet.validate_many: incorrect type for term %r (got '%s', expected 'str')"
+                                % (term, type(term).__name__))
+            valid[i] = term in self.__terms
+        return valid
+
     @property
     def view_set(self):
         """
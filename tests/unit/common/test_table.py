@@ -11,6 +11,7 @@ from hdmf.backends.hdf5 import H5DataIO, HDF5IO
 from hdmf.backends.hdf5.h5tools import H5_TEXT, H5PY_3
 from hdmf.common import (DynamicTable, VectorData, VectorIndex, ElementIdentifiers, EnumData,
                          DynamicTableRegion, get_manager, SimpleMultiContainer)
+from hdmf.common.table import _uint_precision
 from hdmf.testing import TestCase, H5RoundTripMixin, remove_test_file
 from hdmf.utils import StrDataset
 
@@ -276,6 +277,105 @@ class TestDynamicTable(TestCase):
         self.add_rows(table)
         self.check_table(table)
 
+    def test_add_rows(self):
+        table = self.with_spec()
+        table.add_rows({'foo': [1, 2, 3], 'bar': [10.0, 20.0, 30.0], 'baz': ['cat', 'dog', 'bird']})
+        table.add_rows(data={'foo': [4, 5], 'bar': [40.0, 50.0], 'baz': ['fish', 'lizard']})
+        self.check_table(table)
+
+    def test_add_rows_list_of_dicts(self):
+        table = self.with_spec()
+        table.add_rows([{'foo': 1, 'bar': 10.0, 'baz': 'cat'},
+                        {'foo': 2, 'bar': 20.0, 'baz': 'dog'},
+                        {'foo': 3, 'bar': 30.0, 'baz': 'bird'}])
+        table.add_rows([])
+        table.add_rows([{'foo': 4, 'bar': 40.0, 'baz': 'fish'}, {'foo': 5, 'bar': 50.0, 'baz': 'lizard'}])
+        self.check_table(table)
+
+    def test_add_rows_list_of_dicts_mismatched_keys(self):
+        table = self.with_spec()
+        msg = "all rows must have the same keys"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows([{'foo': 1, 'bar': 10.0, 'baz': 'cat'}, {'foo': 2, 'bar': 20.0}])
+        self.assertEqual(len(table), 0)
+
+    def test_add_rows_ids(self):
+        table = self.with_spec()
+        table.add_rows({'foo': [1, 2], 'bar': [10.0, 20.0], 'baz': ['cat', 'dog']}, id=[10, 11])
+        self.assertListEqual(table.id.data, [10, 11])
+        msg = "ids are not unique in the table"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'foo': [3], 'bar': [30.0], 'baz': ['bird']}, id=[11], enforce_unique_id=True)
+        self.assertEqual(len(table), 2)
+
+    def test_add_rows_ragged(self):
+        table = DynamicTable(name='table', description='a test table')
+        table.add_column(name='qux', description='qux column', index=True)
+        table.add_rows({'qux': [['a', 'b'], ['c'], ['d', 'e', 'f']]})
+        self.assertListEqual(table['qux'][:], [['a', 'b'], ['c'], ['d', 'e', 'f']])
+        self.assertListEqual(table.id.data, [0, 1, 2])
+
+    def test_add_rows_ragged_bad_cell(self):
+        table = DynamicTable(name='table', description='a test table')
+        table.add_column(name='a', description='a column')
+        table.add_column(name='qux', description='qux column', index=True)
+        msg = "column 'qux' is ragged, so each of its values must be a list or array, not int"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'a': [1, 2], 'qux': [['x'], 5]})
+        self.assertEqual(len(table), 0)
+        self.assertEqual(len(table['a']), 0)
+        self.assertListEqual(table['qux'].target.data, [])
+
+    def test_add_rows_ragged_bad_nested_cell(self):
+        table = DynamicTable(name='table', description='a test table')
+        table.add_column(name='qux', description='qux column', index=2)
+        msg = "column 'qux' is ragged, so each of its values must be a list or array, not int"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'qux': [[['x']], [['y'], 5]]})
+        self.assertEqual(len(table), 0)
+
+    @unittest.skipIf(not LINKML_INSTALLED, "optional LinkML module is not installed")
+    def test_add_rows_ragged_term_set_bad_value(self):
+        terms = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
+        qux = VectorData(name='qux', description='qux column', term_set=terms)
+        qux_index = VectorIndex(name='qux_index', target=qux, data=list())
+        table = DynamicTable(name='table', description='a test table',
+                             columns=[VectorData(name='a', description='a column'), qux, qux_index])
+        with self.assertRaisesWith(ValueError, '"bad" is not in the term set.'):
+            table.add_rows({'a': [1, 2], 'qux': [['Mus musculus'], ['bad']]})
+        self.assertEqual(len(table), 0)
+        self.assertEqual(len(table['a']), 0)
+        self.assertListEqual(qux.data, [])
+
+    def test_add_rows_scalar_values(self):
+        table = self.with_spec()
+        msg = "the values of column 'foo' must be a list or array, not int"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'foo': 1, 'bar': [10.0], 'baz': ['cat']})
+        msg = "the values of column 'baz' must be a list or array, not str"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'foo': [1], 'bar': [10.0], 'baz': 'cat'})
+        self.assertEqual(len(table), 0)
+
+    def test_add_rows_unequal_length(self):
+        table = self.with_spec()
+        msg = "columns must be the same length"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'foo': [1, 2], 'bar': [10.0], 'baz': ['cat', 'dog']})
+        self.assertEqual(len(table), 0)
+
+    def test_add_rows_bad_ids_length(self):
+        table = self.with_spec()
+        msg = "must provide same number of ids as length of columns"
+        with self.assertRaisesWith(ValueError, msg):
+            table.add_rows({'foo': [1, 2], 'bar': [10.0, 20.0], 'baz': ['cat', 'dog']}, id=[0])
+
+    def test_add_rows_missing_column(self):
+        table = self.with_spec()
+        with self.assertRaisesRegex(ValueError, "row data keys don't match available columns"):
+            table.add_rows({'foo': [1, 2], 'bar': [10.0, 20.0], 'qux': ['cat', 'dog']})
+        self.assertEqual(len(table), 0)
+
     def test_get(self):
         table = self.with_spec()
         self.add_rows(table)
@@ -377,6 +477,26 @@ class TestDynamicTable(TestCase):
         self.assertListEqual(table['qux'][:], expected + [[10, 11, 12], ])
         self.assertListEqual(table.qux_index.data, [3, 7, 10])
 
+    def test_add_column_auto_index_ndarray(self):
+        """
+        Add a column as a list of 1D arrays and check that the flattened data is a list of the original values
+        """
+        table = self.with_spec()
+        table.add_row(foo=5, bar=50.0, baz='lizard')
+        table.add_row(foo=5, bar=50.0, baz='lizard')
+        table.add_column(name='qux',
+                         description='qux column',
+                         data=[np.array([1, 2, 3]), np.array([1, 2, 3.5, 4])],
+                         index=True)
+        self.assertIsInstance(table.qux.data, list)
+        self.assertListEqual(table.qux.data, [1, 2, 3, 1, 2, 3.5, 4])
+        self.assertListEqual(table['qux'][0], [1, 2, 3])
+        self.assertListEqual(table.qux_index.data, [3, 7])
+        # Add more rows after we created the column
+        table.add_row(foo=5, bar=50.0, baz='lizard', qux=[10, 11, 12])
+        np.testing.assert_array_equal(table['qux'][2], [10, 11, 12])
+        self.assertListEqual(table.qux_index.data, [3, 7, 10])
+
     def test_add_column_auto_multi_index_int(self):
         """
         Add a column as a list of lists of lists after we have already added data so that we need to create a
@@ -669,6 +789,18 @@ class TestDynamicTable(TestCase):
                                                column_descriptions=coldesc)
         self.assertContainerEqual(expected, received, ignore_hdmf_attrs=True)
 
+    def test_from_dataframe_ragged(self):
+        df = pd.DataFrame({
+            'a': [[1, 2, 3],
+                  [1],
+                  [1, 2]],
+            'b': ['4', '5', '6']
+        })
+        received = DynamicTable.from_dataframe(df, 'test_table')
+        self.assertIsInstance(received['a'], VectorIndex)
+        self.assertListEqual(received['a'][:], [[1, 2, 3], [1], [1, 2]])
+        self.assertListEqual(received['a'].data, [3, 4, 6])
+
     def test_from_dataframe_dup_attr(self):
         """
         Test that when a DynamicTable is generated from a dataframe where one of the column names is an existing
@@ -705,6 +837,17 @@ class TestDynamicTable(TestCase):
         with self.assertRaises(ValueError):
             table.add_row(id=10, data={'foo': 1, 'bar': 10.0, 'baz': 'cat'}, enforce_unique_id=True)
 
+    def test_enforce_unique_id_after_other_adds(self):
+        table = self.with_spec()
+        table.add_row(id=10, data={'foo': 1, 'bar': 10.0, 'baz': 'cat'}, enforce_unique_id=True)
+        table.add_row(id=11, data={'foo': 2, 'bar': 20.0, 'baz': 'dog'})
+        table.add_rows({'foo': [3], 'bar': [30.0], 'baz': ['bird']}, id=[12])
+        for row_id in (10, 11, 12):
+            with self.assertRaises(ValueError):
+                table.add_row(id=row_id, data={'foo': 1, 'bar': 10.0, 'baz': 'cat'}, enforce_unique_id=True)
+        table.add_row(id=13, data={'foo': 4, 'bar': 40.0, 'baz': 'fish'}, enforce_unique_id=True)
+        self.assertListEqual(table.id.data, [10, 11, 12, 13])
+
     def test_not_enforce_unique_id_error(self):
         table = self.with_spec()
         table.add_row(id=10, data={'foo': 1, 'bar': 10.0, 'baz': 'cat'}, enforce_unique_id=False)
@@ -880,6 +1023,26 @@ Fields:
         table = self.with_columns_and_data()
         self.assertFalse(table == test_table)
 
+    def test_eq_diff_num_rows(self):
+        columns = [
+            VectorData(name=s['name'], description=s['description'], data=d[:-1])
+            for s, d in zip(self.spec, self.data)
+        ]
+        test_table = DynamicTable(name="with_columns_and_data", description='a test table', columns=columns)
+
+        table = self.with_columns_and_data()
+        self.assertFalse(table == test_table)
+
+    def test_eq_diff_col_order(self):
+        columns = [
+            VectorData(name=s['name'], description=s['description'], data=d)
+            for s, d in zip(self.spec, self.data)
+        ]
+        test_table = DynamicTable(name="with_columns_and_data", description='a test table', columns=columns[::-1])
+
+        table = self.with_columns_and_data()
+        self.assertFalse(table == test_table)
+
     def test_eq_diff_name(self):
         columns = [
             VectorData(name=s['name'], description=s['description'], data=d)
@@ -905,6 +1068,22 @@ Fields:
         table = self.with_columns_and_data()
         self.assertFalse(table == container)
 
+    def test_create_region(self):
+        table = self.with_columns_and_data()
+        region = table.create_region(name='region', region=[0, 2, 4], description='a region')
+        self.assertIsInstance(region, DynamicTableRegion)
+        self.assertIs(region.table, table)
+        self.assertListEqual(region.data, [0, 2, 4])
+
+    def test_create_region_out_of_range(self):
+        table = self.with_columns_and_data()
+        msg = "The index 5 is out of range for this DynamicTable of length 5"
+        with self.assertRaisesWith(IndexError, msg):
+            table.create_region(name='region', region=[0, 5, 6], description='a region')
+        msg = "The index -1 is out of range for this DynamicTable of length 5"
+        with self.assertRaisesWith(IndexError, msg):
+            table.create_region(name='region', region=(-1, 0), description='a region')
+
 
 class TestDynamicTableRoundTrip(H5RoundTripMixin, TestCase):
 
@@ -992,6 +1171,21 @@ class TestDynamicTableRegion(TestCase):
         self.assertEqual(len(res.columns), 1)
         self.assertListEqual(res['bar'].tolist(), [10.0, 20.0, 30.0, 30.0])
 
+    def test_dynamic_table_region_to_dataframe_unsorted(self):
+        table = self.with_columns_and_data()
+        dynamic_table_region = DynamicTableRegion(name='dtr', data=[4, 0, 4, 1], description='desc', table=table)
+        res = dynamic_table_region.to_dataframe()
+        self.assertListEqual(res.index.tolist(), [4, 0, 4, 1])
+        self.assertListEqual(res['foo'].tolist(), [5, 1, 5, 2])
+        self.assertListEqual(res['baz'].tolist(), ['lizard', 'cat', 'lizard', 'dog'])
+
+    def test_dynamic_table_region_to_dataframe_empty(self):
+        table = self.with_columns_and_data()
+        dynamic_table_region = DynamicTableRegion(name='dtr', data=[], description='desc', table=table)
+        res = dynamic_table_region.to_dataframe()
+        self.assertEqual(len(res), 0)
+        self.assertListEqual(res.columns.tolist(), ['foo', 'bar', 'baz'])
+
     def test_dynamic_table_region_getitem_slice(self):
         table = self.with_columns_and_data()
         dynamic_table_region = DynamicTableRegion(name='dtr', data=[0, 1, 2, 2], description='desc', table=table)
@@ -1544,6 +1738,16 @@ class TestDynamicTableClassColumns(TestCase):
         self.assertListEqual(table.col2.data, ['b', 'b2'])
         # self.assertListEqual(table.col4.data, [('d1', 'd2'), ('d3', 'd4')])  # TODO this should work
 
+    def test_add_rows_opt_column(self):
+        """Test that adding rows with an optional column works."""
+        table = SubTable(name='subtable', description='subtable description')
+        table.add_rows(dict(col1=['a', 'a'], col2=['b', 'b2'], col3=[['c'], ['c']], col5=['e', 'e'],
+                            col7=[['g'], ['g']], col6=None))
+        self.assertTupleEqual(table.colnames, ('col1', 'col3', 'col5', 'col7', 'col2'))
+        self.assertEqual(table.col2.description, 'optional column')
+        self.assertListEqual(table.col2.data, ['b', 'b2'])
+        self.assertListEqual(table.col3_index.data, [1, 2])
+
     def test_add_row_opt_column_after_data(self):
         """Test that adding a row with an optional column after adding a row without the column raises an error."""
         table = SubTable(name='subtable', description='subtable description')
@@ -1642,6 +1846,13 @@ class TestEnumData(TestCase):
         dat = ed[[0, 1]]
         np.testing.assert_array_equal(dat, [['a', 'a'], ['b', 'b']])
 
+    def test_get_ndarray_elements(self):
+        ed = EnumData(name='cv_data', description='a test EnumData',
+                      elements=np.array(['a', 'b', 'c']),
+                      data=np.array([[0, 0], [1, 1], [2, 2]]))
+        np.testing.assert_array_equal(ed[[0, 2]], [['a', 'a'], ['c', 'c']])
+        self.assertEqual(ed.get(slice(0, 2), join=True), 'aabb')
+
     def test_add_row(self):
         ed = EnumData(name='cv_data', description='a test EnumData', elements=['a', 'b', 'c'])
         ed.add_row('b')
@@ -1649,6 +1860,28 @@ class TestEnumData(TestCase):
         ed.add_row('c')
         np.testing.assert_array_equal(ed.data, np.array([1, 0, 2], dtype=np.uint8))
 
+    def test_uint_precision(self):
+        self.assertIs(_uint_precision(['a', 'b', 'c']), np.uint8)
+        self.assertIs(_uint_precision(256), np.uint8)
+        self.assertIs(_uint_precision(257), np.uint16)
+        self.assertIs(_uint_precision(2 ** 16), np.uint16)
+        self.assertIs(_uint_precision(2 ** 16 + 1), np.uint32)
+        self.assertIs(_uint_precision(2 ** 24 + 1), np.uint32)
+        self.assertIs(_uint_precision(2 ** 32), np.uint32)
+        self.assertIs(_uint_precision(2 ** 32 + 1), np.uint64)
+
+    def test_add_row_inc_precision(self):
+        elements = ['e%d' % i for i in range(256)]
+        ed = EnumData(name='cv_data', description='a test EnumData', elements=elements)
+        ed.add_row('e255')
+        ed.add_row('e0')
+        self.assertEqual(ed.data[0].dtype, np.uint8)
+        ed.add_row('new')  # the 257th element does not fit in uint8
+        self.assertIsInstance(ed.data, list)
+        self.assertTrue(all(val.dtype == np.uint16 for val in ed.data))
+        self.assertListEqual(ed.data, [255, 0, 256])
+        self.assertListEqual(list(ed[:]), ['e255', 'e0', 'new'])
+
     def test_add_row_index(self):
         ed = EnumData(name='cv_data', description='a test EnumData', elements=['a', 'b', 'c'])
         ed.add_row(1, index=True)
@@ -2131,6 +2364,55 @@ class TestVectorIndex(TestCase):
         self.assertListEqual(foo_ind[0], ['a', 'b'])
         self.assertListEqual(foo_ind[1], ['c'])
 
+    def test_get_bool_mask(self):
+        foo = VectorData(name='foo', description='foo column', data=['a', 'b', 'c'])
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=[2, 3])
+        self.assertListEqual(foo_ind.get([False, True]), [['c']])
+        self.assertListEqual(foo_ind.get(np.array([True, False])), [['a', 'b']])
+
+    def test_get_empty(self):
+        foo = VectorData(name='foo', description='foo column', data=['a', 'b', 'c'])
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=[2, 3])
+        self.assertListEqual(foo_ind.get([]), [])
+
+    def test_extend(self):
+        foo = VectorData(name='foo', description='foo column', data=['a', 'b', 'c'])
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=[2, 3])
+        foo_ind.extend([['d', 'e', 'f'], ['g']])
+        self.assertListEqual(foo.data, ['a', 'b', 'c', 'd', 'e', 'f', 'g'])
+        self.assertListEqual(foo_ind.data, [2, 3, 6, 7])
+        self.assertEqual(type(foo_ind.data[-1]), np.uint8)
+        self.assertListEqual(foo_ind[2], ['d', 'e', 'f'])
+        self.assertListEqual(foo_ind[3], ['g'])
+
+    def test_extend_bad_value(self):
+        foo = VectorData(name='foo', description='foo column', data=['a', 'b', 'c'])
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=[2, 3])
+        msg = "Each value added to VectorIndex 'foo_index' must be a list or array."
+        with self.assertRaisesWith(ValueError, msg):
+            foo_ind.extend([['d', 'e'], 5])
+        self.assertListEqual(foo.data, ['a', 'b', 'c'])
+        self.assertListEqual(foo_ind.data, [2, 3])
+        foo_ind.add_vector(['z'])
+        self.assertListEqual(foo_ind[2], ['z'])
+
+    @unittest.skipIf(not LINKML_INSTALLED, "optional LinkML module is not installed")
+    def test_extend_term_set_bad_value(self):
+        terms = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
+        foo = VectorData(name='foo', description='foo column', data=['Homo sapiens'], term_set=terms)
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=[1])
+        with self.assertRaisesWith(ValueError, '"bad" is not in the term set.'):
+            foo_ind.extend([['Mus musculus'], ['bad']])
+        self.assertListEqual(foo.data, ['Homo sapiens'])
+        self.assertListEqual(foo_ind.data, [1])
+
+    def test_extend_inc_precision(self):
+        foo = VectorData(name='foo', description='foo column')
+        foo_ind = VectorIndex(name='foo_index', target=foo, data=np.array([]))
+        foo_ind.extend([list(range(255)), list(range(65281))])
+        np.testing.assert_array_equal(foo_ind.data, [255, 65536])
+        self.assertEqual(foo_ind.data.dtype, np.uint32)
+
 
 class TestDoubleIndex(TestCase):
 
@@ -2278,6 +2560,13 @@ class TestDynamicTableAddEnum(TestCase):
                            index=pd.Series(name='id', data=[0, 1, 2]))
         pd.testing.assert_frame_equal(exp, rec)
 
+    def test_enum_from_dataframe(self):
+        df = pd.DataFrame(data={'bar': ['a', 'b', 'a', 'c']}, index=pd.Series(name='id', data=[0, 1, 2, 3]))
+        table = DynamicTable.from_dataframe(df=df, name='table0',
+                                            columns=[{'name': 'bar', 'description': 'an enum column', 'enum': True}])
+        self.assertEqual(table['bar'].data.dtype, np.uint8)
+        pd.testing.assert_frame_equal(df, table.to_dataframe())
+
 
 class TestDynamicTableInitIndexRoundTrip(H5RoundTripMixin, TestCase):
 
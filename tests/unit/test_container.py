@@ -1,4 +1,6 @@
+import copy
 import numpy as np
+import pickle
 from uuid import uuid4, UUID
 import os
 
@@ -80,6 +82,22 @@ class TestContainer(TestCase):
         child_obj._in_construct_mode = False
         self.assertFalse(child_obj._in_construct_mode)
 
+    def test_object_id_stable(self):
+        """Test that the object ID generated on first access is returned on later accesses.
+        """
+        obj = Container('obj1')
+        object_id = obj.object_id
+        self.assertEqual(obj.object_id, object_id)
+        self.assertNotEqual(Container('obj2').object_id, object_id)
+
+    def test_object_id_copy(self):
+        """Test that copies and unpickled objects share the object ID of a container whose ID was not yet read.
+        """
+        for copy_func in (copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))):
+            obj = Container('obj1')
+            obj_copy = copy_func(obj)
+            self.assertEqual(obj.object_id, obj_copy.object_id)
+
     def test_init(self):
         """Test that __init__ properly sets object ID and other fields.
         """
@@ -181,6 +199,20 @@ class TestContainer(TestCase):
         child_obj.set_modified()
         self.assertTrue(child_obj.parent.modified)
 
+    def test_set_modified_ancestors(self):
+        """Test that set modified sets all ancestors modified
+        """
+        grandparent_obj = Container('obj1')
+        parent_obj = Container('obj2')
+        child_obj = Container('obj3')
+        parent_obj.parent = grandparent_obj
+        child_obj.parent = parent_obj
+        for obj in (grandparent_obj, parent_obj, child_obj):
+            obj.set_modified(False)
+        child_obj.set_modified()
+        self.assertTrue(parent_obj.modified)
+        self.assertTrue(grandparent_obj.modified)
+
     def test_add_child(self):
         """Test that add child creates deprecation warning and also properly sets child's parent and modified
         """
@@ -325,6 +357,28 @@ class TestContainer(TestCase):
         self.assertTrue(parent_obj.modified)
         self.assertTrue(child_obj.modified)
 
+    def test_children_updated(self):
+        """Test that the children tuple reflects children that are added and removed after it was read.
+        """
+        parent_obj = Container('obj1')
+        self.assertTupleEqual(parent_obj.children, ())
+        child_obj = Container('obj2')
+        child_obj.parent = parent_obj
+        self.assertTupleEqual(parent_obj.children, (child_obj, ))
+        self.assertIs(parent_obj.children, parent_obj.children)
+        parent_obj._remove_child(child_obj)
+        self.assertTupleEqual(parent_obj.children, ())
+
+    def test_remove_child_after_copy(self):
+        """Test that children can be removed from a deep-copied or unpickled container.
+        """
+        table = DynamicTable(name='t', description='a table')
+        for copied in (copy.deepcopy(table), pickle.loads(pickle.dumps(table))):
+            child = copied.children[0]
+            copied._remove_child(child)
+            self.assertIsNone(child.parent)
+            self.assertNotIn(child, copied.children)
+
     def test_remove_child_noncontainer(self):
         """Test that removing a non-Container child raises an error.
         """
@@ -455,6 +509,20 @@ class TestData(TestCase):
         data_obj = Data('my_data', [[0, 1, 2, 3, 4], [0, 1, 2, 3, 4]])
         self.assertTupleEqual(data_obj.shape, (2, 5))
 
+    def test_extend_1d_nparray(self):
+        """Test that extending 1D np.array data appends the new values
+        """
+        data_obj = Data('my_data', np.array([1, 2, 3]))
+        data_obj.extend([4, 5])
+        np.testing.assert_array_equal(data_obj.data, [1, 2, 3, 4, 5])
+
+    def test_extend_2d_nparray(self):
+        """Test that extending 2D np.array data appends the new rows
+        """
+        data_obj = Data('my_data', np.arange(10).reshape(2, 5))
+        data_obj.extend(np.arange(5).reshape(1, 5))
+        np.testing.assert_array_equal(data_obj.data, [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9], [0, 1, 2, 3, 4]])
+
     @unittest.skipIf(not LINKML_INSTALLED, "optional LinkML module is not installed")
     def test_validate(self):
         terms = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
@@ -492,8 +560,10 @@ class TestData(TestCase):
     def test_extend_validate_bad_data_error(self):
         terms = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
         data_obj = Data(name='species', data=['Homo sapiens'], term_set=terms)
-        with self.assertRaises(ValueError):
+        msg = '"Oryctolagus cuniculus" is not in the term set.'
+        with self.assertRaisesWith(ValueError, msg):
             data_obj.extend(['Mus musculus', 'Oryctolagus cuniculus'])
+        self.assertEqual(data_obj.data, ['Homo sapiens'])  # no terms are added if any term is invalid
 
 
 class TestAbstractContainerFieldsConf(TestCase):
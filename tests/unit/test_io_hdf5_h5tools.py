@@ -834,6 +834,42 @@ class TestHDF5IO(TestCase):
             self.assertEqual(io.manager, self.manager)
             self.assertEqual(io.source, self.path)
 
+    def test_chunk_cache(self):
+        with HDF5IO(self.path, manager=self.manager, mode='w', rdcc_nbytes=8*1024*1024, rdcc_nslots=1009,
+                    rdcc_w0=0.5) as io:
+            _, nslots, nbytes, w0 = io._file.id.get_access_plist().get_cache()
+            self.assertEqual(nslots, 1009)
+            self.assertEqual(nbytes, 8*1024*1024)
+            self.assertEqual(w0, 0.5)
+
+    def test_chunk_cache_w0_int(self):
+        for w0 in (0, 1):
+            with HDF5IO(self.path, manager=self.manager, mode='w', rdcc_w0=w0) as io:
+                self.assertEqual(io._file.id.get_access_plist().get_cache()[3], w0)
+
+    def test_chunk_cache_w0_out_of_range(self):
+        msg = "rdcc_w0 must be between 0 and 1, got 1.5"
+        with self.assertRaisesWith(ValueError, msg):
+            HDF5IO(self.path, manager=self.manager, mode='w', rdcc_w0=1.5)
+
+    def test_chunk_cache_default(self):
+        with File(self.path, 'w') as f:
+            default_cache = f.id.get_access_plist().get_cache()
+        with HDF5IO(self.path, manager=self.manager, mode='r') as io:
+            self.assertTupleEqual(io._file.id.get_access_plist().get_cache(), default_cache)
+
+    def test_flush(self):
+        with HDF5IO(self.path, manager=self.manager, mode='w') as io:
+            io.write(self.foofile)
+            io.flush()
+            self.assertTrue(io._file)  # flushing does not close the file
+
+    def test_flush_closed(self):
+        io = HDF5IO(self.path, manager=self.manager, mode='w')
+        io.close()
+        with self.assertRaisesWith(UnsupportedOperation, "Cannot flush closed HDF5 file '%s'" % self.path):
+            io.flush()
+
     def test_delete_with_incomplete_construction_missing_file(self):
         """
         Here we test what happens when `close` is called before `HDF5IO.__init__` has
@@ -378,6 +378,24 @@ class TestOverrideInit(TestCase):
         baz.containers = {}
         self.assertDictEqual(baz.containers, {})
 
+    def test_override_getitem(self):
+        """Test that overriding __getitem__ works."""
+
+        class Qux(MultiContainerInterface):
+
+            __clsconf__ = {
+                'attr': 'containers',
+                'add': 'add_container',
+                'type': Container,
+            }
+
+            def __getitem__(self, index):
+                return list(self.containers.values())[index]
+
+        obj1 = Container('obj1')
+        qux = Qux(containers=[obj1])
+        self.assertIs(qux[0], obj1)
+
 
 class TestNoClsConf(TestCase):
 
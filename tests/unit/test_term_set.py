@@ -1,3 +1,5 @@
+import numpy as np
+
 from hdmf.term_set import TermSet
 from hdmf.testing import TestCase
 import unittest
@@ -32,6 +34,19 @@ class TestTermSet(TestCase):
         termset = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
         self.assertEqual(termset.validate('missing_term'), False)
 
+    @unittest.skipIf(not LINKML_INSTALLED, "optional LinkML module is not installed")
+    def test_termset_validate_many(self):
+        termset = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
+        valid = termset.validate_many(['Homo sapiens', 'missing_term', 'Mus musculus'])
+        np.testing.assert_array_equal(valid, [True, False, True])
+
+    @unittest.skipIf(not LINKML_INSTALLED, "optional LinkML module is not installed")
+    def test_termset_validate_many_non_str(self):
+        termset = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')
+        msg = "TermSet.validate_many: incorrect type for term 5 (got 'int', expected 'str')"
+        with self.assertRaisesWith(TypeError, msg):
+            termset.validate_many(['Homo sapiens', 5])
+
     @unittest.skipIf(not LINKML_INSTALLED, "optional LinkML module is not installed")
     def test_get_item(self):
         termset = TermSet(term_schema_path='tests/unit/example_test_term_set.yaml')